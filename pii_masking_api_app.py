@@ -14,10 +14,12 @@ Redis・Pub/Sub・DuckDB など GCP マネージドサービスに
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import os
 import re
+import threading
 from typing import Dict, List, Optional
 
 from fastapi import FastAPI, HTTPException
@@ -28,23 +30,82 @@ from pydantic import BaseModel
 REGEX_PATTERNS = [
     re.compile(r"\b0\d{1,3}-\d{1,4}-\d{4}\b"),  # 電話番号 03-1234-5678
     re.compile(r"\b\d{3}-\d{4}\b"),  # 郵便番号 123-4567
-    re.compile(r"\b\d{3}\d{4}\d{4}\d{4}\b"),  # マイナンバー 1234567890123
+    re.compile(r"\b\d{12}\b"),  # マイナンバー (12 桁)
 ]
 
+# 全パターンを 1 つの選択肢にまとめ、テキスト走査を 1 パスに抑える
+COMBINED_REGEX = re.compile("|".join(f"(?:{p.pattern})" for p in REGEX_PATTERNS))
+
+# Hyperscan が利用可能なら SIMD マルチパターン DFA でスキャン (無ければ re)
+try:
+    import hyperscan
+
+    _hs_db = hyperscan.Database()
+    _hs_db.compile(
+        expressions=[p.pattern.encode() for p in REGEX_PATTERNS],
+        ids=list(range(len(REGEX_PATTERNS))),
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8]
+        * len(REGEX_PATTERNS),
+    )
+except Exception:  # import または DB コンパイル失敗時は re にフォールバック
+    _hs_db = None
+
+
+def _regex_mask(text: str) -> str:
+    """Mask all REGEX_PATTERNS matches in a single scanning pass."""
+    if _hs_db is None:
+        return COMBINED_REGEX.sub("<MASK>", text)
+
+    data = text.encode("utf-8")
+    spans: List[tuple] = []
+
+    def _on_match(_id: int, start: int, end: int, _flags: int, _ctx=None) -> None:
+        spans.append((start, end))
+
+    _hs_db.scan(data, match_event_handler=_on_match)
+    if not spans:
+        return text
+
+    # 重複・包含スパンをまとめて 1 回の join で組み立てる
+    spans.sort()
+    parts = []
+    cur = 0
+    for start, end in spans:
+        if start < cur:
+            cur = max(cur, end)
+            continue
+        parts.append(data[cur:start])
+        parts.append(b"<MASK>")
+        cur = end
+    parts.append(data[cur:])
+    return b"".join(parts).decode("utf-8")
+
+
 # 簡易トークナイザ (SudachiPy 置き換え可)
+# 辞書ロードは重いので import 時ではなく初回利用時に遅延初期化し、
+# Tokenizer はスレッドセーフでないためスレッドローカルに保持する
+SUDACHI_SPLIT_MODE = os.getenv("SUDACHI_SPLIT_MODE", "C").upper()
+
 try:
     from sudachipy import dictionary
     from sudachipy import tokenizer as sudachi_tokenizer
 
-    _tokenizer_obj = dictionary.Dictionary().create()
+    _tokenizer_local = threading.local()
+    _split_mode = getattr(
+        sudachi_tokenizer.Tokenizer.SplitMode,
+        SUDACHI_SPLIT_MODE,
+        sudachi_tokenizer.Tokenizer.SplitMode.C,
+    )
+
+    def _get_tokenizer():
+        tok = getattr(_tokenizer_local, "tok", None)
+        if tok is None:
+            tok = dictionary.Dictionary().create()
+            _tokenizer_local.tok = tok
+        return tok
 
     def tokenize(text: str) -> List[str]:
-        return [
-            m.surface()
-            for m in _tokenizer_obj.tokenize(
-                text, sudachi_tokenizer.Tokenizer.SplitMode.C
-            )
-        ]
+        return [m.surface() for m in _get_tokenizer().tokenize(text, _split_mode)]
 
 except ModuleNotFoundError:
 
@@ -55,27 +116,61 @@ except ModuleNotFoundError:
 # Mock NER using gazetteer (本番では ONNX Runtime + DistilBERT INT8)
 GAZETTEER_NAMES = {"佐藤", "鈴木", "高橋", "田中", "山田"}
 
+# 全 gazetteer 語をリテラル選択肢 1 本にまとめ、トークナイズなしで
+# 原文を 1 パス走査する (C レベルのマルチパターンマッチ)
+GAZETTEER_REGEX = re.compile(
+    "|".join(map(re.escape, sorted(GAZETTEER_NAMES, key=len, reverse=True)))
+)
+
 
 def ner_entities(text: str) -> List[Dict[str, str]]:
-    entities = []
-    for token in tokenize(text):
-        if token in GAZETTEER_NAMES:
-            entities.append({"text": token, "label": "PERSON"})
-    return entities
+    return [
+        {"text": m.group(), "label": "PERSON"} for m in GAZETTEER_REGEX.finditer(text)
+    ]
+
+
+# PII パターンと gazetteer を 1 本の選択肢に融合し、走査と置換を 1 パスで行う
+MASK_REGEX = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in REGEX_PATTERNS)
+    + f"|(?P<person>{GAZETTEER_REGEX.pattern})"
+)
+
+
+def mask_and_extract(text: str) -> tuple:
+    """1 パスでマスク済みテキストとエンティティ一覧を得る"""
+    entities: List[Dict[str, str]] = []
+
+    def _repl(m: re.Match) -> str:
+        if m.lastgroup == "person":
+            entities.append({"text": m.group(), "label": "PERSON"})
+        return "<MASK>"
+
+    return MASK_REGEX.sub(_repl, text), entities
 
 
 # Simple mask replacement
 def apply_masks(text: str, entities: List[Dict[str, str]]) -> str:
-    masked = text
-    # Regex first
-    for pattern in REGEX_PATTERNS:
-        masked = pattern.sub("<MASK>", masked)
+    # Regex first (single scanning pass, Hyperscan if available)
+    masked = _regex_mask(text)
     # Entity mask
     for ent in entities:
         masked = masked.replace(ent["text"], "<MASK>")
     return masked
 
 
+# JSON serialization: orjson (C 実装) があれば使い、無ければ stdlib json
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ModuleNotFoundError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
 # Redis cache ---------------------------------------------------------------
 REDIS_DSN = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 try:
@@ -104,6 +199,32 @@ async def cache_set(key: str, value: str, ttl: int = 60 * 60 * 24):
         pass
 
 
+async def cache_get_many(keys: List[str]) -> List[Optional[str]]:
+    """複数キーを 1 回のラウンドトリップで取得 (pipeline)"""
+    if redis_client is None or not keys:
+        return [None] * len(keys)
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.get(key)
+            return await pipe.execute()
+    except Exception:
+        return [None] * len(keys)
+
+
+async def cache_set_many(items: Dict[str, str], ttl: int = 60 * 60 * 24):
+    """複数キーを 1 回のラウンドトリップで格納 (pipeline)"""
+    if redis_client is None or not items:
+        return
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, value, ex=ttl)
+            await pipe.execute()
+    except Exception:
+        pass
+
+
 # Pub/Sub mock (fire-and-forget) -------------------------------------------
 PUBSUB_ENABLED = os.getenv("PUBSUB", "false").lower() == "true"
 if PUBSUB_ENABLED:
@@ -139,6 +260,13 @@ def compute_risk_score(entities: List[Dict[str, str]]) -> float:
     return 0.9
 
 
+def _process_text(text: str):
+    """CPU バウンドな マスク + リスク算出 (スレッドプールで実行する)"""
+    masked, entities = mask_and_extract(text)
+    risk_score = compute_risk_score(entities)
+    return masked, entities, risk_score
+
+
 # FastAPI ------------------------------------------------------------------
 app = FastAPI(title="CPU‑Only PII Masking API")
 
@@ -160,19 +288,15 @@ async def mask_endpoint(req: MaskRequest):
     if not text:
         raise HTTPException(status_code=400, detail="text is required")
 
-    key = hashlib.sha256(text.encode()).hexdigest()
+    key = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
     cached_val = await cache_get(key)
     if cached_val:
-        resp_dict = json.loads(cached_val)
+        resp_dict = _json_loads(cached_val)
         resp_dict["cached"] = True
         return resp_dict
 
-    # 1. Regex + NER
-    entities = ner_entities(text)
-    masked = apply_masks(text, entities)
-
-    # 2. Risk score (sync) & enqueue for batch risk aggregation (async)
-    risk_score = compute_risk_score(entities)
+    # 1-2. Regex + NER + risk score はスレッドプールで実行しイベントループを塞がない
+    masked, entities, risk_score = await asyncio.to_thread(_process_text, text)
     enqueue_for_risk_calc({"entities": entities, "risk_score": risk_score})
 
     resp = {
@@ -183,10 +307,56 @@ async def mask_endpoint(req: MaskRequest):
     }
 
     # 3. Cache
-    await cache_set(key, json.dumps(resp))
+    await cache_set(key, _json_dumps(resp))
     return resp
 
 
+class MaskBatchRequest(BaseModel):
+    texts: List[str]
+
+
+class MaskBatchResponse(BaseModel):
+    results: List[MaskResponse]
+
+
+@app.post("/mask_batch", response_model=MaskBatchResponse)
+async def mask_batch_endpoint(req: MaskBatchRequest):
+    if not req.texts:
+        raise HTTPException(status_code=400, detail="texts is required")
+
+    keys = [
+        hashlib.blake2b(text.encode(), digest_size=16).hexdigest() for text in req.texts
+    ]
+
+    # 1 回の pipeline で全キーを引く
+    cached_vals = await cache_get_many(keys)
+
+    results: List[dict] = []
+    to_store: Dict[str, str] = {}
+    for text, key, cached_val in zip(req.texts, keys, cached_vals):
+        if cached_val:
+            resp_dict = _json_loads(cached_val)
+            resp_dict["cached"] = True
+            results.append(resp_dict)
+            continue
+
+        masked, entities, risk_score = await asyncio.to_thread(_process_text, text)
+        enqueue_for_risk_calc({"entities": entities, "risk_score": risk_score})
+
+        resp = {
+            "masked_text": masked,
+            "entities": entities,
+            "risk_score": risk_score,
+            "cached": False,
+        }
+        results.append(resp)
+        to_store[key] = _json_dumps(resp)
+
+    # キャッシュミス分も 1 回の pipeline で書き戻す
+    await cache_set_many(to_store)
+    return {"results": results}
+
+
 # uvicorn エントリ point
 if __name__ == "__main__":
     import uvicorn
@@ -1,9 +1,11 @@
 """FastAPI application for PII masking service."""
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field, validator
 
@@ -13,11 +15,22 @@ from ..core.pipeline import MaskingPipeline
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create FastAPI app
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm the pipeline on startup; nothing to tear down on shutdown."""
+    await warmup_pipeline()
+    yield
+
+
+# Create FastAPI app. No custom response class: with response_model set
+# on the route, FastAPI serializes straight to JSON bytes via Pydantic,
+# and a custom class would force the slower legacy render path.
 app = FastAPI(
     title="PII Masking API",
     description="API for masking personally identifiable information in Japanese text",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Initialize masking pipeline
@@ -29,6 +42,23 @@ except Exception as e:
     logger.error(f"Failed to initialize pipeline: {e}")
 
 
+class PipelineFailure(Exception):
+    """Raised when the masking pipeline fails while serving a request.
+
+    Handled by a dedicated exception handler, so the error path skips
+    Starlette's generic ServerErrorMiddleware re-raise machinery.
+    """
+
+
+def get_pipeline() -> Optional[MaskingPipeline]:
+    """Dependency accessor for the process-wide pipeline.
+
+    Reading the module global at call time keeps one shared pipeline in
+    production while letting tests swap it via dependency_overrides.
+    """
+    return pipeline
+
+
 # Request/Response models
 class MaskRequest(BaseModel):
     """Request model for masking endpoint."""
@@ -40,6 +70,10 @@ class MaskRequest(BaseModel):
     @validator("text")
     def validate_text_bytes(cls, v: str) -> str:
         """Validate text is within byte limits."""
+        # UTF-8 is at most 4 bytes per character, so short strings cannot
+        # exceed the limit and need no trial encoding
+        if len(v) * 4 <= 1024:
+            return v
         if len(v.encode("utf-8")) > 1024:
             raise ValueError("text exceeds 1024 bytes")
         return v
@@ -61,6 +95,24 @@ class MaskResponse(BaseModel):
     cached: bool = Field(..., description="Whether response was served from cache")
 
 
+async def warmup_pipeline() -> None:
+    """Run one masking pass before serving traffic.
+
+    The first call pays for Sudachi dictionary loading, regex
+    compilation, and model session setup; doing it here keeps that cost
+    out of the first real request.
+    """
+    if pipeline is None:
+        return
+    try:
+        await asyncio.to_thread(
+            pipeline.mask_text, "田中さんの電話番号は03-1234-5678です。"
+        )
+        logger.info("Pipeline warmup complete")
+    except Exception as e:
+        logger.warning(f"Pipeline warmup failed: {e}")
+
+
 # Health check endpoint
 @app.get("/")
 async def health_check() -> Dict[str, str]:
@@ -70,12 +122,16 @@ async def health_check() -> Dict[str, str]:
 
 # Main masking endpoint
 @app.post("/mask", response_model=MaskResponse)
-async def mask_text(request: MaskRequest) -> MaskResponse:
+async def mask_text(
+    request: MaskRequest,
+    masking_pipeline: Optional[MaskingPipeline] = Depends(get_pipeline),
+) -> MaskResponse:
     """
     Mask PII in the provided text.
 
     Args:
         request: MaskRequest containing text to be masked
+        masking_pipeline: Shared pipeline injected via get_pipeline
 
     Returns:
         MaskResponse with masked text and metadata
@@ -85,7 +141,7 @@ async def mask_text(request: MaskRequest) -> MaskResponse:
         500: Internal server error
     """
     # Check if pipeline is initialized
-    if pipeline is None:
+    if masking_pipeline is None:
         logger.error("Pipeline not initialized")
         raise HTTPException(status_code=500, detail="Internal server error")
 
@@ -94,8 +150,9 @@ async def mask_text(request: MaskRequest) -> MaskResponse:
         if not request.text or request.text.isspace():
             raise HTTPException(status_code=400, detail="text is required")
 
-        # Process text through pipeline
-        result = pipeline.mask_text(request.text)
+        # Process text through pipeline in a worker thread so the event
+        # loop stays free to accept other requests while masking runs
+        result = await asyncio.to_thread(masking_pipeline.mask_text, request.text)
 
         # Convert entities to response format
         entities = [
@@ -110,8 +167,8 @@ async def mask_text(request: MaskRequest) -> MaskResponse:
             cached=result.cached,
         )
 
-    except HTTPException:
-        # Re-raise HTTP exceptions
+    except (HTTPException, PipelineFailure):
+        # Re-raise exceptions with their own handlers
         raise
     except Exception as e:
         # Log unexpected errors
@@ -120,6 +177,18 @@ async def mask_text(request: MaskRequest) -> MaskResponse:
 
 
 # Error handlers
+@app.exception_handler(PipelineFailure)
+async def pipeline_failure_handler(
+    request: Request, exc: PipelineFailure
+) -> JSONResponse:
+    """Handle pipeline failures without the generic 500 re-raise path."""
+    logger.error(f"Pipeline failure: {exc}")
+    return JSONResponse(
+        status_code=500,
+        content={"detail": "Internal server error"},
+    )
+
+
 @app.exception_handler(422)
 async def validation_exception_handler(request: Request, exc: Any) -> JSONResponse:
     """Handle validation errors."""
@@ -0,0 +1 @@
+"""Caching layer for PII masking pipeline."""
@@ -0,0 +1,44 @@
+"""Cache key generation and validation."""
+
+import hashlib
+import re
+from typing import Optional
+
+# Optional word-character prefix, then exactly 64 hex digits; one C-level
+# match call replaces the partition + length + per-character checks
+_KEY_RE = re.compile(r"\A(?:\w+:)?[0-9a-fA-F]{64}\Z", re.ASCII)
+
+
+def generate_cache_key(text: str, prefix: Optional[str] = None) -> str:
+    """
+    Generate a deterministic cache key for the given text.
+
+    The text is encoded to UTF-8 exactly once and hashed with SHA-256.
+    Deliberately not memoized: a memo would pin raw request texts -
+    unmasked PII - in process memory for the worker's lifetime, and the
+    hash is cheap relative to that exposure.
+
+    Args:
+        text: Input text to derive the key from
+        prefix: Optional namespace prefix (e.g. "mask")
+
+    Returns:
+        Hex digest, optionally prefixed as "<prefix>:<digest>"
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    if prefix:
+        return f"{prefix}:{digest}"
+    return digest
+
+
+def is_valid_cache_key(key: str) -> bool:
+    """
+    Check whether a string is a well-formed cache key.
+
+    Args:
+        key: Candidate cache key
+
+    Returns:
+        True if the key is a SHA-256 hex digest with an optional prefix
+    """
+    return _KEY_RE.match(key) is not None
@@ -0,0 +1,177 @@
+"""In-memory cache implementations."""
+
+import json
+import time
+from dataclasses import replace
+from typing import Any, Dict, Optional, Tuple
+
+from ..core.exceptions import CacheError
+from ..core.interfaces import CacheProvider, MaskingResult
+
+# Upper bound on the MaskingResultCache object fast path; mirrors the
+# InMemoryCache default so the two layers stay roughly the same size
+_MAX_RESULTS = 4096
+
+
+class InMemoryCache(CacheProvider):
+    """Simple in-memory cache with TTL support and bounded LRU eviction."""
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        """
+        Initialize empty cache.
+
+        Args:
+            max_entries: Maximum number of entries kept; inserting beyond
+                         this evicts the least recently used entry
+        """
+        self._store: Dict[str, Tuple[str, float]] = {}
+        self._hits: Dict[str, int] = {}
+        self._max_entries = max_entries
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Retrieve value from cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None if not found or expired
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._store[key]
+            return None
+
+        # Refresh recency: dicts iterate in insertion order, so moving a
+        # hit entry to the end makes the front the LRU eviction candidate
+        del self._store[key]
+        self._store[key] = entry
+
+        self._hits[key] = self._hits.get(key, 0) + 1
+        return value
+
+    def set(self, key: str, value: str, ttl: float = 3600) -> None:
+        """
+        Store value in cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+        """
+        if key not in self._store and len(self._store) >= self._max_entries:
+            self._store.pop(next(iter(self._store)))
+        self._store[key] = (value, time.monotonic() + ttl)
+
+    def clear_expired(self) -> int:
+        """
+        Remove all expired entries.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.monotonic()
+        expired = [key for key, (_, exp) in self._store.items() if now >= exp]
+        for key in expired:
+            del self._store[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        self._store.clear()
+        self._hits.clear()
+
+    def size(self) -> int:
+        """Return number of entries currently stored."""
+        return len(self._store)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return cache hit statistics.
+
+        Returns:
+            Dictionary with total hit count and per-key distribution
+        """
+        return {
+            "total_hits": sum(self._hits.values()),
+            "hit_distribution": dict(self._hits),
+        }
+
+
+class MaskingResultCache:
+    """Caches MaskingResult objects on top of a CacheProvider."""
+
+    def __init__(self, cache: CacheProvider) -> None:
+        """
+        Initialize result cache.
+
+        Args:
+            cache: Underlying cache provider for serialized results
+        """
+        self.cache = cache
+        # Process-local fast path: keeps the deserialized result object so
+        # repeat hits skip the JSON round-trip entirely. Liveness is still
+        # governed by the underlying cache's TTL.
+        self._results: Dict[str, MaskingResult] = {}
+
+    def get_result(self, key: str) -> Optional[MaskingResult]:
+        """
+        Retrieve a cached masking result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            MaskingResult marked as cached, or None if not found
+
+        Raises:
+            CacheError: If cached data cannot be deserialized
+        """
+        raw = self.cache.get(key)
+        if raw is None:
+            self._results.pop(key, None)
+            return None
+
+        result = self._results.get(key)
+        if result is not None:
+            return replace(result, cached=True)
+
+        try:
+            data = json.loads(raw)
+            return MaskingResult(
+                masked_text=data["masked_text"],
+                entities=[],
+                risk_score=data["risk_score"],
+                cached=True,
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            raise CacheError(f"Failed to deserialize cached result: {e}")
+
+    def set_result(self, key: str, result: MaskingResult, ttl: float = 3600) -> None:
+        """
+        Store a masking result.
+
+        Entities are intentionally not cached; only the masked text and
+        risk score are needed to serve a cache hit.
+
+        Args:
+            key: Cache key
+            result: Result to cache
+            ttl: Time to live in seconds
+        """
+        payload = json.dumps(
+            {
+                "masked_text": result.masked_text,
+                "risk_score": result.risk_score,
+            },
+            ensure_ascii=False,
+        )
+        self.cache.set(key, payload, ttl=ttl)
+        if key not in self._results and len(self._results) >= _MAX_RESULTS:
+            self._results.pop(next(iter(self._results)))
+        self._results[key] = replace(result, entities=[])
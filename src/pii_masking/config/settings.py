@@ -35,6 +35,10 @@ class Settings(BaseSettings):
     # Regex patterns file
     regex_patterns_file: str = "config/regex_patterns.yaml"
 
+    # Prefer the linear-time RE2 engine for the combined pattern scan;
+    # disable to force the backtracking stdlib engine
+    regex_use_re2: bool = True
+
     # NER Configuration
     ner_confidence_threshold: float = 0.5
 
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Entity:
     """Represents a detected PII entity."""
 
@@ -16,7 +16,7 @@ class Entity:
     confidence: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MaskingResult:
     """Result of PII masking operation."""
 
@@ -61,7 +61,7 @@ class CacheProvider(ABC):
         pass
 
     @abstractmethod
-    def set(self, key: str, value: str, ttl: int = 3600) -> None:
+    def set(self, key: str, value: str, ttl: float = 3600) -> None:
         """
         Store value in cache.
 
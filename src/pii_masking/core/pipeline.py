@@ -1,5 +1,8 @@
 """Main masking pipeline orchestrator."""
 
+import re
+from bisect import bisect_right
+from itertools import accumulate
 from typing import Any, Dict, List, Optional
 
 from ..cache.cache_key import generate_cache_key
@@ -13,6 +16,15 @@ from ..processors.tokenizer import JapaneseTokenizer
 from ..processors.validator import Validator
 from .interfaces import CacheProvider, Entity, MaskingResult
 
+# Mask token hoisted out of the per-entity loops: enum attribute
+# resolution is not free and the value never changes
+_MASK = MaskToken.DEFAULT.value
+
+# Hiragana, katakana, CJK ideographs (including the compatibility block).
+# Text without any of these cannot produce Japanese NER entities, so the
+# pipeline skips Sudachi - its dominant cost - for such inputs.
+_HAS_CJK = re.compile(r"[\u3040-\u30ff\u3400-\u9fff\uf900-\ufaff]")
+
 
 class MaskingPipeline:
     """Main orchestrator for PII masking pipeline."""
@@ -43,11 +55,25 @@ class MaskingPipeline:
         self.validator = validator or Validator()
         self.cache = cache or InMemoryCache()
         self.result_cache = MaskingResultCache(self.cache)
-        self.regex_processor = regex_processor or RegexProcessor()
+        self.regex_processor = regex_processor or RegexProcessor.shared()
         self.tokenizer = tokenizer or JapaneseTokenizer()
         self.ner_processor = ner_processor or NERProcessor(use_mock=True)
         self.risk_scorer = risk_scorer or RiskScorer()
 
+        # Gazetteer terms without any CJK character (e.g. "NHK") can
+        # still produce entities in otherwise non-Japanese text, so the
+        # no-CJK fast path below must also check for them
+        non_cjk_terms = sorted(
+            term
+            for term in getattr(self.ner_processor, "GAZETTEER", {})
+            if _HAS_CJK.search(term) is None
+        )
+        self._non_cjk_terms: Optional[re.Pattern[str]] = (
+            re.compile("|".join(re.escape(term) for term in non_cjk_terms))
+            if non_cjk_terms
+            else None
+        )
+
     def mask_text(self, text: str) -> MaskingResult:
         """
         Execute full masking pipeline.
@@ -76,11 +102,20 @@ class MaskingPipeline:
         # Step 3: Apply regex masking
         context = self.regex_processor.process(text, context)
 
-        # Step 4: Tokenize
-        context = self.tokenizer.process(text, context)
-
-        # Step 5: Apply NER
-        context = self.ner_processor.process(text, context)
+        # Step 4-5: Tokenize and apply NER. Input without any CJK code
+        # point and without any non-CJK gazetteer term cannot match the
+        # NER path, so skip the tokenizer (the dominant cost) entirely
+        # and feed empty token context downstream.
+        if _HAS_CJK.search(text) is None and (
+            self._non_cjk_terms is None or self._non_cjk_terms.search(text) is None
+        ):
+            context["tokens"] = []
+            context["token_surfaces"] = []
+            context["token_positions"] = []
+            context["ner_entities"] = []
+        else:
+            context = self.tokenizer.process(text, context)
+            context = self.ner_processor.process(text, context)
 
         # Step 6: Apply final masking
         masked_text = self._apply_final_masking(text, context)
@@ -128,20 +163,34 @@ class MaskingPipeline:
 
         # Get NER entities
         ner_entities = context.get("ner_entities", [])
+        if not ner_entities:
+            return masked_text
+
+        # Apply NER masking in one left-to-right pass: collect the slices
+        # between masked spans and join once, instead of rebuilding the
+        # whole string per entity
+        parts = []
+        cursor = 0
+        length = len(masked_text)
+        for entity in sorted(ner_entities, key=lambda e: e.start):
+            start = entity.start
+            end = entity.end
+
+            # Skip spans overlapping an already-applied mask
+            if start < cursor:
+                continue
 
-        # Apply NER masking (from right to left to preserve positions)
-        for entity in sorted(ner_entities, key=lambda e: e.start, reverse=True):
-            # Check if this position was already masked by regex
-            if self._is_already_masked(masked_text, entity.start, entity.end):
+            # Skip positions already masked by regex (inlined
+            # _is_already_masked to avoid per-entity method dispatch)
+            if start >= length or end > length or _MASK in masked_text[start:end]:
                 continue
 
-            # Apply mask
-            mask_token = MaskToken.DEFAULT.value
-            masked_text = (
-                masked_text[: entity.start] + mask_token + masked_text[entity.end :]
-            )
+            parts.append(masked_text[cursor:start])
+            parts.append(_MASK)
+            cursor = end
+        parts.append(masked_text[cursor:])
 
-        return masked_text
+        return "".join(parts)
 
     def _is_already_masked(self, text: str, start: int, end: int) -> bool:
         """
@@ -159,7 +208,7 @@ class MaskingPipeline:
             return True
 
         segment = text[start:end]
-        return MaskToken.DEFAULT in segment
+        return _MASK in segment
 
     def _merge_entities(
         self, regex_entities: List[Entity], ner_entities: List[Entity]
@@ -174,22 +223,23 @@ class MaskingPipeline:
         Returns:
             Merged list of entities
         """
-        all_entities = []
-
-        # Add regex entities
-        all_entities.extend(regex_entities)
-
-        # Add NER entities that don't overlap with regex
-        for ner_entity in ner_entities:
-            overlaps = False
-            for regex_entity in regex_entities:
-                if (
-                    ner_entity.start >= regex_entity.start
-                    and ner_entity.end <= regex_entity.end
-                ):
-                    overlaps = True
-                    break
-            if not overlaps:
+        if not regex_entities:
+            return sorted(ner_entities, key=lambda e: e.start)
+
+        all_entities = list(regex_entities)
+
+        if ner_entities:
+            # Sort regex spans by start and keep a running maximum of their
+            # ends; an NER entity is contained in some regex span iff a span
+            # starting at or before it reaches at least as far as its end.
+            spans = sorted((e.start, e.end) for e in regex_entities)
+            starts = [s for s, _ in spans]
+            max_ends = list(accumulate((e for _, e in spans), max))
+
+            for ner_entity in ner_entities:
+                idx = bisect_right(starts, ner_entity.start) - 1
+                if idx >= 0 and max_ends[idx] >= ner_entity.end:
+                    continue
                 all_entities.append(ner_entity)
 
         # Sort by position
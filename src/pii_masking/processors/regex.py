@@ -1,16 +1,32 @@
 """Regex-based PII detection and masking."""
 
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, NamedTuple, Pattern
+from typing import Any, Dict, List, NamedTuple, Pattern, Tuple
 
 import yaml
 
+try:
+    # google-re2 executes patterns as a linear-time DFA, so a pathological
+    # pattern in a user-supplied YAML file cannot ReDoS the API. It rejects
+    # backreferences and lookarounds at compile time; pattern sets using
+    # those fall back to the stdlib engine below.
+    import re2
+except ImportError:  # pragma: no cover - declared dependency
+    re2 = None
+
 from ..config.constants import MaskToken
 from ..config.settings import get_settings
 from ..core.exceptions import ProcessingError
 from ..core.interfaces import Entity, Processor
 
+# Resolved once at import: relative patterns paths are tried against the
+# project root first, then the package config directory
+_PROJECT_ROOT = Path(__file__).resolve().parents[3]
+_CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+
 
 class RegexPattern(NamedTuple):
     """Represents a regex pattern for PII detection."""
@@ -18,6 +34,78 @@ class RegexPattern(NamedTuple):
     name: str
     pattern: Pattern[str]
     description: str = ""
+    # Interned uppercase entity label, computed once at load time so
+    # matches reuse one shared str instead of calling .upper() per match
+    label: str = ""
+    # re flag constants requested in the YAML config (e.g. ASCII); kept
+    # so the combined alternation can scope them per sub-pattern
+    flags: int = 0
+
+
+# Flag names accepted in the YAML "flags" list, with the inline letter
+# used to scope them inside the combined alternation
+_FLAG_MAP = {
+    "ASCII": (re.ASCII, "a"),
+    "IGNORECASE": (re.IGNORECASE, "i"),
+    "DOTALL": (re.DOTALL, "s"),
+    "MULTILINE": (re.MULTILINE, "m"),
+}
+
+
+# Compiled patterns shared across all RegexProcessor instances, keyed by
+# (resolved path, st_mtime_ns); YAML parsing and regex compilation happen
+# once per file revision, and editing the file invalidates automatically
+_PATTERN_CACHE: Dict[Tuple[str, int], Tuple[RegexPattern, ...]] = {}
+
+# Combined single-pass alternation per patterns-file revision and engine
+# choice, built from the same validated sub-patterns; group g<i> maps back
+# to patterns[i]. The value is an re2 pattern when the set compiles under
+# RE2, else an re pattern.
+_COMBINED_CACHE: Dict[Tuple[str, int, bool], Any] = {}
+
+
+def clear_pattern_cache() -> None:
+    """Drop all cached compiled patterns (intended for tests)."""
+    _PATTERN_CACHE.clear()
+    _COMBINED_CACHE.clear()
+
+
+# Bracketed character classes, stripped before sentinel detection so a
+# byte that is merely one alternative inside a class is not treated as
+# required
+_CHAR_CLASS_RE = re.compile(r"\[[^\]]*\]")
+
+# Non-nested negative lookarounds, stripped first: their contents assert
+# absence, so a \d inside (?!\d) must not count as a required digit
+_NEG_LOOKAROUND_RE = re.compile(r"\(\?<?![^()]*\)")
+
+
+def _required_sentinel(source: str) -> str:
+    """Return a byte class the pattern cannot match without, or "".
+
+    Best-effort and deliberately conservative: any construct that could
+    make the candidate byte optional (top-level alternation, zero-
+    repetition of a digit, a lookaround too complex to strip) disables
+    the sentinel for that pattern, which in turn disables the prefilter
+    for the whole set.
+    """
+    stripped = _NEG_LOOKAROUND_RE.sub("", source)
+    if "(?!" in stripped or "(?<!" in stripped:
+        return ""
+    stripped = _CHAR_CLASS_RE.sub("", stripped)
+    if "|" in stripped or r"\d?" in stripped or r"\d*" in stripped:
+        return ""
+    if r"\d{0," in stripped:
+        return ""
+    # An optional group could wrap the candidate byte; give up rather
+    # than track grouping structure
+    if ")?" in stripped or ")*" in stripped or "){0," in stripped:
+        return ""
+    if "@" in stripped:
+        return "@"
+    if r"\d" in stripped:
+        return "0-9"
+    return ""
 
 
 class RegexProcessor(Processor):
@@ -41,6 +129,23 @@ class RegexProcessor(Processor):
         else:
             self.patterns_file = self.settings.regex_patterns_file
         self.patterns = self._load_patterns()
+        self._names = [p.name for p in self.patterns]
+        self._labels = [p.label for p in self.patterns]
+        self._combined = self._build_combined()
+        self._prefilter = self._build_prefilter()
+
+    @classmethod
+    def shared(cls, patterns_file: str | None = None) -> "RegexProcessor":
+        """Return the process-wide processor for the given patterns file.
+
+        The processor is stateless after construction (patterns and the
+        combined alternation are immutable), so one instance per patterns
+        file can be shared across requests and threads. lru_cache holds
+        its internal lock only around the memo lookup; a racing first
+        call can at worst build a second instance, which is cheap because
+        the compiled patterns themselves are cached module-wide.
+        """
+        return _shared_processor(patterns_file)
 
     def _load_patterns(self) -> List[RegexPattern]:
         """Load regex patterns from YAML file."""
@@ -48,20 +153,24 @@ class RegexProcessor(Processor):
 
         # Try relative to project root first
         if not patterns_path.is_absolute():
-            project_root = Path(__file__).parent.parent.parent.parent
-            patterns_path = project_root / patterns_path
+            patterns_path = _PROJECT_ROOT / patterns_path
 
         if not patterns_path.exists():
             # Try relative to config directory
-            patterns_path = (
-                Path(__file__).parent.parent / "config" / "regex_patterns.yaml"
-            )
+            patterns_path = _CONFIG_DIR / "regex_patterns.yaml"
 
         if not patterns_path.exists():
             raise ProcessingError(
                 f"Regex patterns file not found: {self.patterns_file}"
             )
 
+        self._resolved_path = str(patterns_path)
+        cache_key = (self._resolved_path, patterns_path.stat().st_mtime_ns)
+        self._cache_key = cache_key
+        cached = _PATTERN_CACHE.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         try:
             with open(patterns_path, "r", encoding="utf-8") as f:
                 data = yaml.safe_load(f)
@@ -71,12 +180,15 @@ class RegexProcessor(Processor):
         patterns = []
         for pattern_config in data.get("patterns", []):
             try:
-                compiled = re.compile(pattern_config["regex"])
+                flags = self._parse_flags(pattern_config)
+                compiled = re.compile(pattern_config["regex"], flags)
                 patterns.append(
                     RegexPattern(
                         name=pattern_config["name"],
                         pattern=compiled,
                         description=pattern_config.get("description", ""),
+                        label=sys.intern(pattern_config["name"].upper()),
+                        flags=flags,
                     )
                 )
             except re.error as e:
@@ -84,8 +196,87 @@ class RegexProcessor(Processor):
                     f"Invalid regex pattern '{pattern_config['name']}': {e}"
                 )
 
+        _PATTERN_CACHE[cache_key] = tuple(patterns)
         return patterns
 
+    @staticmethod
+    def _parse_flags(pattern_config: Dict[str, Any]) -> int:
+        """OR together the re flag constants named in a pattern config."""
+        flags = 0
+        for flag_name in pattern_config.get("flags", []):
+            if flag_name not in _FLAG_MAP:
+                raise ProcessingError(
+                    f"Unknown regex flag '{flag_name}' for pattern "
+                    f"'{pattern_config['name']}'"
+                )
+            flags |= _FLAG_MAP[flag_name][0]
+        return flags
+
+    def _build_combined(self) -> Any:
+        """Build the single alternation covering all loaded patterns.
+
+        Prefers the RE2 engine for its linear-time worst case unless the
+        regex_use_re2 setting disables it; pattern sets that use
+        constructs RE2 rejects (lookarounds, backreferences) keep the
+        backtracking stdlib engine.
+        """
+        use_re2 = re2 is not None and self.settings.regex_use_re2
+        cache_key = (*self._cache_key, use_re2)
+        combined = _COMBINED_CACHE.get(cache_key)
+        if combined is None:
+            source = "|".join(
+                f"(?P<g{i}>{self._scoped_source(p)})"
+                for i, p in enumerate(self.patterns)
+            )
+            combined = None
+            # Cheap syntactic pre-check: RE2 logs a parse error to stderr
+            # for lookarounds, so don't even try when one is present
+            has_lookaround = any(tok in source for tok in ("(?=", "(?!", "(?<"))
+            if use_re2 and not has_lookaround:
+                try:
+                    combined = re2.compile(source)
+                except re2.error:
+                    combined = None
+            if combined is None:
+                combined = re.compile(source)
+            _COMBINED_CACHE[cache_key] = combined
+        return combined
+
+    def _build_prefilter(self) -> Pattern[str] | None:
+        """Build a single-character-class gate for the combined scan.
+
+        When every loaded pattern provably requires a byte from a small
+        sentinel set (an ASCII digit or '@' for the shipped patterns),
+        one cheap class search decides whether the full alternation can
+        match at all. Returns None when any pattern lacks a sentinel.
+        """
+        sentinels = set()
+        for p in self.patterns:
+            sentinel = _required_sentinel(p.pattern.pattern)
+            if not sentinel:
+                return None
+            # Patterns compiled without re.ASCII match any Unicode decimal
+            # digit (full-width runs included), so their gate must too
+            if sentinel == "0-9" and not (p.flags & re.ASCII):
+                sentinel = r"\d"
+            sentinels.add(sentinel)
+        return re.compile(f"[{''.join(sorted(sentinels))}]")
+
+    @staticmethod
+    def _scoped_source(p: RegexPattern) -> str:
+        """Return the pattern source with its flags scoped inline.
+
+        Per-pattern flags cannot be OR'ed globally into the combined
+        alternation without leaking into other sub-patterns, so they are
+        applied as an inline (?a:...)-style group instead.
+        """
+        letters = "".join(
+            letter for flag, letter in _FLAG_MAP.values() if p.flags & flag
+        )
+        if not letters:
+            return p.pattern.pattern
+        return f"(?{letters}:{p.pattern.pattern})"
+
     def process(self, text: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Apply regex patterns to detect and mask PII.
@@ -100,44 +291,63 @@ class RegexProcessor(Processor):
         # Get text from context if already validated
         validated_text = context.get("validated_text", text)
 
-        # Track all matches
+        # Prefilter: if no pattern's required sentinel byte occurs in the
+        # text, the combined scan cannot match - skip it entirely
+        if self._prefilter is not None and not self._prefilter.search(validated_text):
+            context["regex_matches"] = []
+            context["regex_match_types"] = []
+            context["regex_type_count"] = 0
+            context["regex_masked_text"] = validated_text
+            return context
+
+        # Track all matches; match types dedup in insertion order as they
+        # are seen (dict keys), avoiding a throwaway set per request
         regex_matches: List[Entity] = []
-        regex_match_types: List[str] = []
+        types_seen: Dict[str, None] = {}
 
-        # Collect all matches first
-        all_matches = []
-        for regex_pattern in self.patterns:
-            for match in regex_pattern.pattern.finditer(validated_text):
-                all_matches.append((match, regex_pattern))
+        # Collect all matches in one combined-alternation pass; the group
+        # name g<i> maps each match back to its source pattern
+        all_matches = [
+            (m.start(), m.end(), m.group(), int(m.lastgroup[1:]))
+            for m in self._combined.finditer(validated_text)
+        ]
 
-        # Sort matches by start position (to handle overlapping matches)
-        all_matches.sort(key=lambda x: x[0].start())
+        # Build entities and the masked text in one forward pass: collect
+        # the slices between matches plus the mask token and join once,
+        # instead of rebuilding the whole string per match. A single
+        # finditer scan yields matches left-to-right and non-overlapping
+        # by construction, so no sort or overlap resolution is needed.
+        mask_token = MaskToken.DEFAULT
+        parts = []
+        cursor = 0
+        for start, end, matched, index in all_matches:
+            assert start >= cursor, "combined scan yielded overlapping matches"
 
-        # Apply replacements from right to left to preserve positions
-        masked_text = validated_text
-        for match, regex_pattern in reversed(all_matches):
-            # Create entity for the match
             entity = Entity(
-                text=match.group(),
-                label=regex_pattern.name.upper(),
-                start=match.start(),
-                end=match.end(),
+                text=matched,
+                label=self._labels[index],
+                start=start,
+                end=end,
             )
             regex_matches.append(entity)
-            regex_match_types.append(regex_pattern.name)
+            types_seen[self._names[index]] = None
 
-            # Replace with mask token
-            mask_token = MaskToken.DEFAULT
-            masked_text = (
-                masked_text[: match.start()] + mask_token + masked_text[match.end() :]
-            )
-
-        # Reverse regex_matches to maintain original order
-        regex_matches.reverse()
+            parts.append(validated_text[cursor:start])
+            parts.append(mask_token)
+            cursor = end
+        parts.append(validated_text[cursor:])
+        masked_text = "".join(parts)
 
         # Update context
         context["regex_matches"] = regex_matches
-        context["regex_match_types"] = list(set(regex_match_types))
+        context["regex_match_types"] = list(types_seen)
+        context["regex_type_count"] = len(types_seen)
         context["regex_masked_text"] = masked_text
 
         return context
+
+
+@lru_cache(maxsize=8)
+def _shared_processor(patterns_file: str | None) -> RegexProcessor:
+    """Memoized constructor backing RegexProcessor.shared()."""
+    return RegexProcessor(patterns_file)
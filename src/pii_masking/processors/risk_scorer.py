@@ -1,11 +1,45 @@
 """Risk scoring for PII masking results."""
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
 
 from ..config.constants import EntityType
 from ..config.settings import get_settings
 from ..core.interfaces import Entity, Processor
 
+# Person label hoisted out of the scoring loops; EntityType is a str enum
+# so plain string comparison is equivalent and skips enum dispatch
+_PERSON = EntityType.PERSON.value
+
+# One bit per known entity label; the diversity tally ORs these into a
+# single int and popcounts it, replacing a per-request set build with
+# integer ops. Regex-derived labels outside EntityType get a bit assigned
+# on first sight.
+_LABEL_BITS: Dict[str, int] = {
+    member.value: 1 << index for index, member in enumerate(EntityType)
+}
+
+
+def _label_bit(label: str) -> int:
+    """Return the stable bit for a label, assigning one if unseen."""
+    bit = _LABEL_BITS.get(label)
+    if bit is None:
+        bit = 1 << len(_LABEL_BITS)
+        _LABEL_BITS[label] = bit
+    return bit
+
+
+# Metrics for the no-entity fast path; shared across requests and
+# treated as immutable by all consumers
+_ZERO_METRICS = {
+    "entity_count": 0,
+    "diversity_score": 0.0,
+    "density_score": 0.0,
+    "person_count": 0,
+    "regex_type_count": 0,
+}
+
 
 class RiskScorer(Processor):
     """Calculates risk score based on detected PII entities."""
@@ -13,6 +47,13 @@ class RiskScorer(Processor):
     def __init__(self) -> None:
         """Initialize risk scorer with settings."""
         self.settings = get_settings()
+        # Score weights never change after startup; reading them from
+        # instance attributes avoids per-call settings lookups on the
+        # request hot path
+        self._base_score = self.settings.risk_base_score
+        self._person_single = self.settings.risk_person_single
+        self._person_multiple = self.settings.risk_person_multiple
+        self._regex_increment = self.settings.risk_regex_increment
 
     def compute_risk_score(
         self,
@@ -31,27 +72,60 @@ class RiskScorer(Processor):
         Returns:
             Risk score between 0.0 and 1.0
         """
-        # Start with base score
-        score = self.settings.risk_base_score
-
         # Count person entities
-        person_count = sum(
-            1 for entity in ner_entities if entity.label == EntityType.PERSON
-        )
+        person_count = sum(1 for entity in ner_entities if entity.label == _PERSON)
+
+        return self._score_from_counts(person_count, len(set(regex_match_types)))
+
+    def _score_from_counts(self, person_count: int, unique_regex_types: int) -> float:
+        """Combine precomputed entity counts into the capped risk score."""
+        # Start with base score
+        score = self._base_score
 
         # Add score based on person count
         if person_count == 1:
-            score += self.settings.risk_person_single
+            score += self._person_single
         elif person_count >= 2:
-            score += self.settings.risk_person_multiple
+            score += self._person_multiple
 
         # Add score for each unique regex match type
-        unique_regex_types = len(set(regex_match_types))
-        score += unique_regex_types * self.settings.risk_regex_increment
+        score += unique_regex_types * self._regex_increment
 
         # Cap at 1.0
         return min(1.0, score)
 
+    def compute_batch(
+        self,
+        person_counts: Sequence[int],
+        regex_type_counts: Sequence[int],
+    ) -> np.ndarray:
+        """
+        Compute risk scores for many documents in one vectorized pass.
+
+        Mirrors _score_from_counts element-wise: base score, person tier,
+        and the per-regex-type increment, capped at 1.0. Batch scoring
+        replaces a Python loop with a handful of NumPy array ops, which
+        amortizes interpreter dispatch across the whole batch.
+
+        Args:
+            person_counts: Person entity count per document
+            regex_type_counts: Unique regex match type count per document
+
+        Returns:
+            Array of risk scores between 0.0 and 1.0, one per document
+        """
+        persons = np.asarray(person_counts, dtype=np.int64)
+        regex_types = np.asarray(regex_type_counts, dtype=np.int64)
+
+        scores = np.full(persons.shape, self._base_score, dtype=np.float64)
+        scores += np.where(
+            persons >= 2,
+            self._person_multiple,
+            np.where(persons == 1, self._person_single, 0.0),
+        )
+        scores += regex_types * self._regex_increment
+        return np.minimum(scores, 1.0)
+
     def _calculate_entity_diversity(self, entities: List[Entity]) -> float:
         """
         Calculate diversity score based on entity types.
@@ -65,9 +139,12 @@ class RiskScorer(Processor):
         if not entities:
             return 0.0
 
-        # Count unique entity types
-        entity_types = set(entity.label for entity in entities)
-        unique_types = len(entity_types)
+        # OR one bit per label and popcount for the unique-type count;
+        # no set allocation or string hashing per call
+        label_mask = 0
+        for entity in entities:
+            label_mask |= _label_bit(entity.label)
+        unique_types = label_mask.bit_count()
 
         # More diverse entity types = higher risk
         diversity_score = min(1.0, unique_types * 0.2)
@@ -111,32 +188,47 @@ class RiskScorer(Processor):
         ner_entities = context.get("ner_entities", [])
         regex_match_types = context.get("regex_match_types", [])
 
-        # Calculate main risk score
-        risk_score = self.compute_risk_score(
-            regex_entities, ner_entities, regex_match_types
-        )
-
-        # Calculate additional metrics
-        all_entities = regex_entities + ner_entities
-        entity_count = len(all_entities)
+        # No-PII fast path: nothing detected means base score and all-zero
+        # metrics, skipping the tally loops and the metrics dict build
+        if not regex_entities and not ner_entities and not regex_match_types:
+            context["risk_score"] = self._base_score
+            context["risk_metrics"] = _ZERO_METRICS
+            return context
+        # RegexProcessor pre-deduplicates match types and stashes the
+        # count; fall back to deduplicating here for hand-built contexts
+        regex_type_count = context.get("regex_type_count", len(set(regex_match_types)))
+
+        # Tally unique labels and person count in one pass over each
+        # entity list instead of re-walking them per metric; the label
+        # tally is a bitmask (OR + popcount) rather than a set build
+        label_mask = 0
+        for entity in regex_entities:
+            label_mask |= _label_bit(entity.label)
+        person_count = 0
+        for entity in ner_entities:
+            label_mask |= _label_bit(entity.label)
+            person_count += entity.label == _PERSON
+        entity_count = len(regex_entities) + len(ner_entities)
 
         # Get text length from context
         text_length = context.get("text_length", 0)
 
-        # Calculate supplementary scores
-        diversity_score = self._calculate_entity_diversity(all_entities)
-        density_score = self._calculate_density_score(text_length, entity_count)
+        # Diversity/density math inlined from the helper methods
+        diversity_score = (
+            min(1.0, label_mask.bit_count() * 0.2) if entity_count else 0.0
+        )
+        density_score = (
+            min(1.0, entity_count / text_length * 20) if text_length else 0.0
+        )
 
         # Update context
-        context["risk_score"] = risk_score
+        context["risk_score"] = self._score_from_counts(person_count, regex_type_count)
         context["risk_metrics"] = {
             "entity_count": entity_count,
             "diversity_score": diversity_score,
             "density_score": density_score,
-            "person_count": sum(
-                1 for e in ner_entities if e.label == EntityType.PERSON
-            ),
-            "regex_type_count": len(regex_match_types),
+            "person_count": person_count,
+            "regex_type_count": regex_type_count,
         }
 
         return context
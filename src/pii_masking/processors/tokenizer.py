@@ -1,12 +1,33 @@
 """Japanese tokenization using SudachiPy."""
 
+import threading
+from functools import lru_cache
 from typing import Any, Dict, List, NamedTuple
 
+import numpy as np
 from sudachipy import Dictionary, SplitMode
 
 from ..core.exceptions import ProcessingError
 from ..core.interfaces import Processor
 
+# Separator used to fuse batched texts into one tokenize call; U+0001 is
+# a control character that never appears in validated input and always
+# tokenizes as its own morpheme
+_SENTINEL = "\u0001"
+
+
+@lru_cache(maxsize=4)
+def _get_dictionary(dict_name: str | None) -> Dictionary:
+    """Load each Sudachi dictionary once per process.
+
+    Dictionary construction mmaps a large dictionary file and dominates
+    tokenizer startup; every JapaneseTokenizer using the same dictionary
+    (core/small/full) shares one instance.
+    """
+    if dict_name is None:
+        return Dictionary()
+    return Dictionary(dict=dict_name)
+
 
 class Token(NamedTuple):
     """Represents a token from tokenization."""
@@ -20,17 +41,22 @@ class Token(NamedTuple):
 class JapaneseTokenizer(Processor):
     """Tokenizes Japanese text using SudachiPy."""
 
-    def __init__(self, split_mode: str = "C") -> None:
+    def __init__(self, split_mode: str = "C", dict_name: str | None = None) -> None:
         """
         Initialize Japanese tokenizer.
 
         Args:
             split_mode: Sudachi split mode ("A", "B", or "C").
                        A: Short unit, B: Middle unit, C: Long unit
+            dict_name: Sudachi dictionary variant ("core", "small",
+                      "full"); None uses the SudachiPy default
         """
         try:
-            self.dictionary = Dictionary()
-            self.tokenizer = self.dictionary.create()
+            self.dictionary = _get_dictionary(dict_name)
+            # Sudachi tokenizer objects are not thread-safe, while the
+            # pipeline is served from a thread pool; each worker thread
+            # lazily gets its own tokenizer from the shared dictionary
+            self._local = threading.local()
 
             # Set split mode
             mode_map = {
@@ -43,6 +69,15 @@ class JapaneseTokenizer(Processor):
         except Exception as e:
             raise ProcessingError(f"Failed to initialize tokenizer: {e}")
 
+    @property
+    def tokenizer(self) -> Any:
+        """The calling thread's Sudachi tokenizer, created on first use."""
+        tokenizer = getattr(self._local, "tokenizer", None)
+        if tokenizer is None:
+            tokenizer = self.dictionary.create()
+            self._local.tokenizer = tokenizer
+        return tokenizer
+
     def process(self, text: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Tokenize Japanese text.
@@ -63,28 +98,122 @@ class JapaneseTokenizer(Processor):
             # Tokenize text
             morphemes = self.tokenizer.tokenize(input_text, self.split_mode)
 
-            # Convert to Token objects
+            # Build all views in a single pass over the morphemes: the
+            # Token objects plus columnar surface/offset arrays, so NER
+            # (which reads surfaces alone) and position lookups touch
+            # compact homogeneous sequences instead of re-deriving them
             tokens = []
+            token_surfaces: List[str] = []
+            token_positions: List[tuple] = []
+            starts: List[int] = []
+            ends: List[int] = []
             for morpheme in morphemes:
-                token = Token(
-                    surface=morpheme.surface(),
-                    pos=morpheme.part_of_speech(),
-                    start=morpheme.begin(),
-                    end=morpheme.end(),
+                surface = morpheme.surface()
+                start = morpheme.begin()
+                end = morpheme.end()
+                tokens.append(
+                    Token(
+                        surface=surface,
+                        pos=morpheme.part_of_speech(),
+                        start=start,
+                        end=end,
+                    )
                 )
-                tokens.append(token)
-
-            # Extract useful information for NER
-            token_surfaces = [token.surface for token in tokens]
-            token_positions = [(token.start, token.end) for token in tokens]
+                token_surfaces.append(surface)
+                token_positions.append((start, end))
+                starts.append(start)
+                ends.append(end)
 
-            # Update context
+            # Update context; the offset columns are int32 ndarrays so
+            # downstream overlap lookups can use np.searchsorted directly
             context["tokens"] = tokens
             context["token_surfaces"] = token_surfaces
             context["token_positions"] = token_positions
+            context["token_starts"] = np.asarray(starts, dtype=np.int32)
+            context["token_ends"] = np.asarray(ends, dtype=np.int32)
             context["tokenized_text"] = input_text  # Keep track of what was tokenized
 
             return context
 
         except Exception as e:
             raise ProcessingError(f"Tokenization failed: {e}")
+
+    @staticmethod
+    def find_tokens_covering(
+        token_starts: np.ndarray,
+        token_ends: np.ndarray,
+        span_starts: np.ndarray,
+        span_ends: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Locate the tokens overlapping each entity span, vectorized.
+
+        Tokens are sorted and non-overlapping, so two binary searches per
+        span batch replace the nested token-by-entity Python loop: for
+        span [s, e), the overlapping tokens are exactly those whose end
+        exceeds s and whose start precedes e.
+
+        Args:
+            token_starts: Sorted token start offsets (from process())
+            token_ends: Token end offsets, same order
+            span_starts: Entity span start offsets
+            span_ends: Entity span end offsets
+
+        Returns:
+            (N, 2) array of [lo, hi) token index ranges, one per span
+        """
+        lo = np.searchsorted(token_ends, span_starts, side="right")
+        hi = np.searchsorted(token_starts, span_ends, side="left")
+        return np.stack([lo, hi], axis=1)
+
+    def tokenize_many(self, texts: List[str]) -> List[List[Token]]:
+        """
+        Tokenize several texts in one Sudachi call.
+
+        The texts are joined with a control-character sentinel, tokenized
+        once, and the morphemes are split back per text with offsets
+        rebased to each text. This amortizes Sudachi's fixed per-call
+        cost across a batch.
+
+        Args:
+            texts: Texts to tokenize; must not contain U+0001
+
+        Returns:
+            One token list per input text, in input order
+        """
+        if not texts:
+            return []
+
+        # Start offset of each text within the joined string
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        try:
+            morphemes = self.tokenizer.tokenize(_SENTINEL.join(texts), self.split_mode)
+
+            results: List[List[Token]] = [[] for _ in texts]
+            index = 0
+            last = len(texts) - 1
+            for morpheme in morphemes:
+                surface = morpheme.surface()
+                if surface == _SENTINEL:
+                    continue
+                begin = morpheme.begin()
+                while index < last and begin >= starts[index + 1] - 1:
+                    index += 1
+                base = starts[index]
+                results[index].append(
+                    Token(
+                        surface=surface,
+                        pos=morpheme.part_of_speech(),
+                        start=begin - base,
+                        end=morpheme.end() - base,
+                    )
+                )
+            return results
+
+        except Exception as e:
+            raise ProcessingError(f"Tokenization failed: {e}")
@@ -35,20 +35,44 @@ class Validator(Processor):
         if not isinstance(text, str):
             raise ValidationError("text must be a string")
 
-        # Check text length
-        text_bytes = text.encode("utf-8")
-        if len(text_bytes) < self.settings.min_text_length:
+        # Check text length. UTF-8 is 1-4 bytes per codepoint, so the
+        # character count bounds the byte count from both sides; reject
+        # definite failures before paying for the encode
+        char_count = len(text)
+        if char_count * 4 < self.settings.min_text_length:
             raise ValidationError(
                 f"text is too short (minimum {self.settings.min_text_length} byte)"
             )
 
-        if len(text_bytes) > self.settings.max_text_length:
+        if char_count > self.settings.max_text_length:
             raise ValidationError(
                 f"text is too long (maximum {self.settings.max_text_length} bytes)"
             )
 
-        # Update context
+        # Pure-ASCII text is exactly 1 byte per character, and CPython
+        # answers isascii() from the string representation flag without
+        # scanning, so the ASCII case skips the encode allocation; other
+        # text encodes once and keeps the bytes for downstream consumers
+        if text.isascii():
+            text_bytes = None
+            byte_length = char_count
+        else:
+            text_bytes = text.encode("utf-8")
+            byte_length = len(text_bytes)
+        if byte_length < self.settings.min_text_length:
+            raise ValidationError(
+                f"text is too short (minimum {self.settings.min_text_length} byte)"
+            )
+
+        if byte_length > self.settings.max_text_length:
+            raise ValidationError(
+                f"text is too long (maximum {self.settings.max_text_length} bytes)"
+            )
+
+        # Update context; text_bytes is None for ASCII input, where the
+        # text itself already is its UTF-8 byte sequence
         context["validated_text"] = text
-        context["text_length"] = len(text_bytes)
+        context["text_bytes"] = text_bytes
+        context["text_length"] = byte_length
 
         return context
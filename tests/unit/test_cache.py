@@ -10,84 +10,116 @@ from pii_masking.cache.memory_cache import InMemoryCache, MaskingResultCache
 from pii_masking.core.exceptions import CacheError
 from pii_masking.core.interfaces import MaskingResult
 
+# Key generation is deterministic, so hash the shared samples once at
+# import; the format tests below only inspect the result
+VALID_KEY = generate_cache_key("test")
+VALID_KEY_PREFIXED = generate_cache_key("test", prefix="mask")
+
+
+@pytest.fixture
+def cache() -> InMemoryCache:
+    """Provide an InMemoryCache cleared after each test."""
+    cache = InMemoryCache()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture
+def base_cache() -> InMemoryCache:
+    """Backing cache for MaskingResultCache tests."""
+    cache = InMemoryCache()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture
+def result_cache(base_cache: InMemoryCache) -> MaskingResultCache:
+    """Provide a MaskingResultCache over the shared backing cache."""
+    return MaskingResultCache(base_cache)
+
 
 class TestInMemoryCache:
     """Test InMemoryCache class."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.cache = InMemoryCache()
-
-    def test_set_and_get(self) -> None:
+    def test_set_and_get(self, cache: InMemoryCache) -> None:
         """Test basic set and get operations."""
-        self.cache.set("key1", "value1")
-        assert self.cache.get("key1") == "value1"
+        cache.set("key1", "value1")
+        assert cache.get("key1") == "value1"
 
-    def test_get_nonexistent(self) -> None:
+    def test_get_nonexistent(self, cache: InMemoryCache) -> None:
         """Test getting non-existent key."""
-        assert self.cache.get("nonexistent") is None
+        assert cache.get("nonexistent") is None
 
-    def test_ttl_expiration(self) -> None:
+    def test_ttl_expiration(
+        self, cache: InMemoryCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test TTL expiration."""
+        now = [time.monotonic()]
+        monkeypatch.setattr(
+            "pii_masking.cache.memory_cache.time.monotonic", lambda: now[0]
+        )
+
         # Set with 0.1 second TTL
-        self.cache.set("key1", "value1", ttl=0.1)
-        assert self.cache.get("key1") == "value1"
+        cache.set("key1", "value1", ttl=0.1)
+        assert cache.get("key1") == "value1"
 
-        # Wait for expiration
-        time.sleep(0.2)
-        assert self.cache.get("key1") is None
+        # Advance the fake clock past expiration instead of sleeping
+        now[0] += 0.2
+        assert cache.get("key1") is None
 
-    def test_clear_expired(self) -> None:
+    def test_clear_expired(
+        self, cache: InMemoryCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test clearing expired entries."""
-        self.cache.set("key1", "value1", ttl=0.1)
-        self.cache.set("key2", "value2", ttl=10)
+        now = [time.monotonic()]
+        monkeypatch.setattr(
+            "pii_masking.cache.memory_cache.time.monotonic", lambda: now[0]
+        )
 
-        # Wait for first key to expire
-        time.sleep(0.2)
+        cache.set("key1", "value1", ttl=0.1)
+        cache.set("key2", "value2", ttl=10)
 
-        removed = self.cache.clear_expired()
+        # Advance the fake clock past the first key's TTL
+        now[0] += 0.2
+
+        removed = cache.clear_expired()
         assert removed == 1
-        assert self.cache.size() == 1
-        assert self.cache.get("key2") == "value2"
+        assert cache.size() == 1
+        assert cache.get("key2") == "value2"
 
-    def test_clear_all(self) -> None:
+    def test_clear_all(self, cache: InMemoryCache) -> None:
         """Test clearing all entries."""
-        self.cache.set("key1", "value1")
-        self.cache.set("key2", "value2")
-        assert self.cache.size() == 2
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        assert cache.size() == 2
 
-        self.cache.clear()
-        assert self.cache.size() == 0
-        assert self.cache.get("key1") is None
+        cache.clear()
+        assert cache.size() == 0
+        assert cache.get("key1") is None
 
-    def test_access_count(self) -> None:
+    def test_access_count(self, cache: InMemoryCache) -> None:
         """Test access counting."""
-        self.cache.set("key1", "value1")
+        cache.set("key1", "value1")
 
         # Access multiple times
         for _ in range(3):
-            self.cache.get("key1")
+            cache.get("key1")
 
-        stats = self.cache.get_stats()
+        stats = cache.get_stats()
         assert stats["total_hits"] == 3
         assert stats["hit_distribution"]["key1"] == 3
 
-    def test_overwrite_value(self) -> None:
+    def test_overwrite_value(self, cache: InMemoryCache) -> None:
         """Test overwriting existing value."""
-        self.cache.set("key1", "value1")
-        self.cache.set("key1", "value2")
-        assert self.cache.get("key1") == "value2"
+        cache.set("key1", "value1")
+        cache.set("key1", "value2")
+        assert cache.get("key1") == "value2"
 
 
 class TestMaskingResultCache:
     """Test MaskingResultCache class."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        self.base_cache = InMemoryCache()
-        self.cache = MaskingResultCache(self.base_cache)
-
-    def test_set_and_get_result(self) -> None:
+    def test_set_and_get_result(self, result_cache: MaskingResultCache) -> None:
         """Test caching MaskingResult."""
         result = MaskingResult(
             masked_text="<MASK>さんです",
@@ -96,33 +128,37 @@ class TestMaskingResultCache:
             cached=False,
         )
 
-        self.cache.set_result("key1", result)
-        cached = self.cache.get_result("key1")
+        result_cache.set_result("key1", result)
+        cached = result_cache.get_result("key1")
 
         assert cached is not None
         assert cached.masked_text == result.masked_text
         assert cached.risk_score == result.risk_score
         assert cached.cached is True  # Should be marked as cached
 
-    def test_get_nonexistent_result(self) -> None:
+    def test_get_nonexistent_result(self, result_cache: MaskingResultCache) -> None:
         """Test getting non-existent result."""
-        assert self.cache.get_result("nonexistent") is None
+        assert result_cache.get_result("nonexistent") is None
 
-    def test_invalid_cached_data(self) -> None:
+    def test_invalid_cached_data(
+        self, result_cache: MaskingResultCache, base_cache: InMemoryCache
+    ) -> None:
         """Test handling of invalid cached data."""
         # Manually set invalid JSON
-        self.base_cache.set("key1", "invalid json")
+        base_cache.set("key1", "invalid json")
 
         with pytest.raises(CacheError, match="Failed to deserialize"):
-            self.cache.get_result("key1")
+            result_cache.get_result("key1")
 
-    def test_incomplete_cached_data(self) -> None:
+    def test_incomplete_cached_data(
+        self, result_cache: MaskingResultCache, base_cache: InMemoryCache
+    ) -> None:
         """Test handling of incomplete cached data."""
         # Set incomplete data
-        self.base_cache.set("key1", json.dumps({"risk_score": 0.5}))
+        base_cache.set("key1", json.dumps({"risk_score": 0.5}))
 
         with pytest.raises(CacheError, match="Failed to deserialize"):
-            self.cache.get_result("key1")
+            result_cache.get_result("key1")
 
 
 class TestCacheKey:
@@ -130,15 +166,13 @@ class TestCacheKey:
 
     def test_generate_cache_key(self) -> None:
         """Test cache key generation."""
-        key = generate_cache_key("test text")
-        assert len(key) == 64  # SHA-256 hex length
-        assert all(c in "0123456789abcdef" for c in key)
+        assert len(VALID_KEY) == 64  # SHA-256 hex length
+        assert all(c in "0123456789abcdef" for c in VALID_KEY)
 
     def test_generate_cache_key_with_prefix(self) -> None:
         """Test cache key generation with prefix."""
-        key = generate_cache_key("test text", prefix="mask")
-        assert key.startswith("mask:")
-        assert len(key) == 69  # "mask:" + 64 hex chars
+        assert VALID_KEY_PREFIXED.startswith("mask:")
+        assert len(VALID_KEY_PREFIXED) == 69  # "mask:" + 64 hex chars
 
     def test_cache_key_deterministic(self) -> None:
         """Test that same input produces same key."""
@@ -156,11 +190,8 @@ class TestCacheKey:
     def test_is_valid_cache_key(self) -> None:
         """Test cache key validation."""
         # Valid keys
-        valid_key = generate_cache_key("test")
-        assert is_valid_cache_key(valid_key)
-
-        valid_key_with_prefix = generate_cache_key("test", prefix="mask")
-        assert is_valid_cache_key(valid_key_with_prefix)
+        assert is_valid_cache_key(VALID_KEY)
+        assert is_valid_cache_key(VALID_KEY_PREFIXED)
 
         # Invalid keys
         assert not is_valid_cache_key("too short")
@@ -9,24 +9,31 @@ from pii_masking.core.exceptions import ModelLoadError, ProcessingError
 from pii_masking.processors.ner import NERProcessor
 
 
+@pytest.fixture(scope="session")
+def processor() -> NERProcessor:
+    """Build one mock NER processor for the whole session.
+
+    The mock processor is stateless across tests, and session scope
+    will amortize model loading if the mock is ever swapped for a real
+    ONNX session.
+    """
+    return NERProcessor(use_mock=True)
+
+
 class TestNERProcessor:
     """Test NERProcessor class."""
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        # Use mock NER for testing
-        self.processor = NERProcessor(use_mock=True)
-
     def test_processor_initialization(self) -> None:
         """Test NER processor initialization."""
+        # Construction semantics checked explicitly, so build locally
         processor = NERProcessor(use_mock=True)
         assert processor.use_mock is True
         assert processor.session is None
 
-    def test_mock_ner_inference(self) -> None:
+    def test_mock_ner_inference(self, processor: NERProcessor) -> None:
         """Test mock NER inference."""
         tokens = ["田中", "さん", "は", "東京", "に", "住んで", "います"]
-        predictions = self.processor._mock_ner_inference(tokens)
+        predictions = processor._mock_ner_inference(tokens)
 
         assert len(predictions) == 2  # 田中 and 東京
         assert predictions[0]["text"] == "田中"
@@ -34,13 +41,13 @@ class TestNERProcessor:
         assert predictions[1]["text"] == "東京"
         assert predictions[1]["label"] == EntityType.LOCATION
 
-    def test_process_with_person_names(self) -> None:
+    def test_process_with_person_names(self, processor: NERProcessor) -> None:
         """Test NER detection of person names."""
         context: Dict[str, Any] = {
             "token_surfaces": ["佐藤", "さん", "が", "来ました"],
             "token_positions": [(0, 2), (2, 4), (4, 5), (5, 9)],
         }
-        result = self.processor.process("", context)
+        result = processor.process("", context)
 
         assert "ner_entities" in result
         assert len(result["ner_entities"]) == 1
@@ -49,7 +56,7 @@ class TestNERProcessor:
         assert result["ner_entities"][0].start == 0
         assert result["ner_entities"][0].end == 2
 
-    def test_process_with_locations(self) -> None:
+    def test_process_with_locations(self, processor: NERProcessor) -> None:
         """Test NER detection of locations."""
         context: Dict[str, Any] = {
             "token_surfaces": ["私", "は", "大阪", "から", "京都", "へ", "行く"],
@@ -63,7 +70,7 @@ class TestNERProcessor:
                 (9, 11),
             ],
         }
-        result = self.processor.process("", context)
+        result = processor.process("", context)
 
         entities = result["ner_entities"]
         assert len(entities) == 2
@@ -72,61 +79,61 @@ class TestNERProcessor:
         assert entities[1].text == "京都"
         assert entities[1].label == EntityType.LOCATION
 
-    def test_process_with_organizations(self) -> None:
+    def test_process_with_organizations(self, processor: NERProcessor) -> None:
         """Test NER detection of organizations."""
         context: Dict[str, Any] = {
             "token_surfaces": ["トヨタ", "と", "ソニー", "の", "株価"],
             "token_positions": [(0, 3), (3, 4), (4, 7), (7, 8), (8, 10)],
         }
-        result = self.processor.process("", context)
+        result = processor.process("", context)
 
         entities = result["ner_entities"]
         assert len(entities) == 2
         assert entities[0].label == EntityType.ORGANIZATION
         assert entities[1].label == EntityType.ORGANIZATION
 
-    def test_process_without_tokens(self) -> None:
+    def test_process_without_tokens(self, processor: NERProcessor) -> None:
         """Test process fails without tokenization."""
         context: Dict[str, Any] = {}
         with pytest.raises(ProcessingError, match="Tokenization required"):
-            self.processor.process("test", context)
+            processor.process("test", context)
 
-    def test_process_with_masked_tokens(self) -> None:
+    def test_process_with_masked_tokens(self, processor: NERProcessor) -> None:
         """Test NER with masked tokens."""
         context: Dict[str, Any] = {
             "token_surfaces": ["<MASK>", "さん", "は", "東京", "に", "います"],
             "token_positions": [(0, 6), (6, 8), (8, 9), (9, 11), (11, 12), (12, 15)],
         }
-        result = self.processor.process("", context)
+        result = processor.process("", context)
 
         # Should only detect 東京, not <MASK>
         entities = result["ner_entities"]
         assert len(entities) == 1
         assert entities[0].text == "東京"
 
-    def test_process_no_entities(self) -> None:
+    def test_process_no_entities(self, processor: NERProcessor) -> None:
         """Test NER with text containing no entities."""
         context: Dict[str, Any] = {
             "token_surfaces": ["今日", "は", "いい", "天気", "です"],
             "token_positions": [(0, 2), (2, 3), (3, 5), (5, 7), (7, 9)],
         }
-        result = self.processor.process("", context)
+        result = processor.process("", context)
 
         assert result["ner_entities"] == []
         assert result["ner_performed"] is True
 
-    def test_model_loading_error(self) -> None:
+    def test_model_loading_error(self, processor: NERProcessor) -> None:
         """Test model loading error handling."""
         with pytest.raises(ModelLoadError, match="Model file not found"):
             NERProcessor(model_path="/nonexistent/model.onnx", use_mock=False)
 
-    def test_multiple_same_entities(self) -> None:
+    def test_multiple_same_entities(self, processor: NERProcessor) -> None:
         """Test handling of multiple occurrences of same entity."""
         context: Dict[str, Any] = {
             "token_surfaces": ["田中", "と", "田中", "が", "話す"],
             "token_positions": [(0, 2), (2, 3), (3, 5), (5, 6), (6, 8)],
         }
-        result = self.processor.process("", context)
+        result = processor.process("", context)
 
         entities = result["ner_entities"]
         assert len(entities) == 2
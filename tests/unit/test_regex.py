@@ -101,6 +101,30 @@ class TestRegexProcessor:
         assert result["regex_masked_text"] == "カード番号: <MASK>"
         assert len(result["regex_matches"]) == 1
 
+    def test_prefilter_enabled_for_default_patterns(self) -> None:
+        """Test the sentinel prefilter engages for the shipped patterns."""
+        # Every shipped pattern requires an ASCII digit or '@'
+        assert self.processor._prefilter is not None
+        # Digit-free, '@'-free Japanese text short-circuits the scan
+        assert (
+            self.processor._prefilter.search("これは個人情報を含まないテキストです。")
+            is None
+        )
+        assert self.processor._prefilter.search("連絡先は03-1234-5678です。")
+
+    def test_prefilter_passes_fullwidth_digits(self) -> None:
+        """Test full-width digit PII is not short-circuited by the gate."""
+        # mynumber stays Unicode-aware in the YAML, so a full-width run
+        # must reach the combined scan and mask
+        text = "番号は１２３４５６７８９０１２です。"
+        assert self.processor._prefilter is not None
+        assert self.processor._prefilter.search(text)
+
+        context: Dict[str, Any] = {"validated_text": text}
+        result = self.processor.process(text, context)
+        assert result["regex_masked_text"] == "番号は<MASK>です。"
+        assert "mynumber" in result["regex_match_types"]
+
     def test_invalid_patterns_file(self) -> None:
         """Test handling of invalid patterns file."""
         with pytest.raises(ProcessingError, match="not found"):
@@ -81,6 +81,25 @@ class TestRiskScorer:
         )
         assert score == 1.0  # Should be capped
 
+    def test_compute_batch_matches_scalar(self) -> None:
+        """Test batch scoring agrees with the scalar path."""
+        person_counts = [0, 1, 2, 3, 0, 1]
+        regex_type_counts = [0, 1, 2, 4, 3, 0]
+
+        scores = self.scorer.compute_batch(person_counts, regex_type_counts)
+
+        assert scores.shape == (6,)
+        for score, persons, regex_types in zip(
+            scores, person_counts, regex_type_counts
+        ):
+            expected = self.scorer._score_from_counts(persons, regex_types)
+            assert abs(score - expected) < 0.001
+
+    def test_compute_batch_empty(self) -> None:
+        """Test batch scoring with an empty batch."""
+        scores = self.scorer.compute_batch([], [])
+        assert scores.shape == (0,)
+
     def test_calculate_entity_diversity(self) -> None:
         """Test entity diversity calculation."""
         entities = [
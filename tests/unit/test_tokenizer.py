@@ -2,6 +2,8 @@
 
 from typing import Any, Dict
 
+import numpy as np
+
 from pii_masking.processors.tokenizer import JapaneseTokenizer, Token
 
 
@@ -78,6 +80,20 @@ class TestJapaneseTokenizer:
             # Verify surface text matches position
             assert text[token.start : token.end] == token.surface
 
+    def test_token_offset_arrays(self) -> None:
+        """Test that columnar offset arrays mirror token positions."""
+        text = "私は日本人です"
+        context: Dict[str, Any] = {"validated_text": text}
+        result = self.tokenizer.process(text, context)
+
+        starts = result["token_starts"]
+        ends = result["token_ends"]
+        assert isinstance(starts, np.ndarray)
+        assert isinstance(ends, np.ndarray)
+        assert [
+            (start, end) for start, end in zip(starts.tolist(), ends.tolist())
+        ] == result["token_positions"]
+
     def test_empty_text(self) -> None:
         """Test tokenization of empty text."""
         text = ""
@@ -118,3 +134,43 @@ class TestJapaneseTokenizer:
         surfaces = result["token_surfaces"]
         assert "！" in surfaces or "!" in surfaces
         assert "？" in surfaces or "?" in surfaces
+
+    def test_find_tokens_covering(self) -> None:
+        """Test vectorized token lookup matches a per-token scan."""
+        text = "田中さんは東京に住んでいます。"
+        context: Dict[str, Any] = {"validated_text": text}
+        result = self.tokenizer.process(text, context)
+
+        starts = result["token_starts"]
+        ends = result["token_ends"]
+        spans = [(0, 2), (5, 7), (0, len(text))]
+        span_starts = np.array([s for s, _ in spans])
+        span_ends = np.array([e for _, e in spans])
+
+        ranges = self.tokenizer.find_tokens_covering(
+            starts, ends, span_starts, span_ends
+        )
+
+        assert ranges.shape == (len(spans), 2)
+        for (span_start, span_end), (lo, hi) in zip(spans, ranges.tolist()):
+            expected = [
+                i
+                for i, token in enumerate(result["tokens"])
+                if token.end > span_start and token.start < span_end
+            ]
+            assert list(range(lo, hi)) == expected
+
+    def test_tokenize_many_matches_individual(self) -> None:
+        """Test batched tokenization matches per-text tokenization."""
+        texts = ["田中さんは東京に住んでいます。", "佐藤さんが来ました"]
+        batched = self.tokenizer.tokenize_many(texts)
+
+        assert len(batched) == len(texts)
+        for text, tokens in zip(texts, batched):
+            context: Dict[str, Any] = {"validated_text": text}
+            expected = self.tokenizer.process(text, context)["tokens"]
+            assert tokens == expected
+
+    def test_tokenize_many_empty_batch(self) -> None:
+        """Test batched tokenization of an empty batch."""
+        assert self.tokenizer.tokenize_many([]) == []